@@ -4,7 +4,8 @@ and serves a tiny frontend for local review.
 
 Usage:
     pip install -r requirements.txt
-    uvicorn backend.app:app --reload
+    uvicorn backend.app:app --reload                                  # dev
+    uvicorn backend.app:app --loop uvloop --http httptools --no-access-log  # serving
 
 The API exposes:
  - POST /api/applications          : Create an application entry (JSON)
@@ -13,18 +14,46 @@ The API exposes:
  - GET  /api/export                : Export CSV of all applications
  - GET  /                           : Tiny demo frontend (served HTML)
 """
-from fastapi import FastAPI, HTTPException, Form
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi import FastAPI, HTTPException, Form, Request
+from fastapi.responses import HTMLResponse, StreamingResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
 from sqlmodel import SQLModel, Field, Session, create_engine, select
+from sqlalchemy import Index, event, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from typing import Optional, List
 from datetime import datetime
-import csv, io, json, re, uuid
+import csv, io, re, uuid
+import orjson
 
 DATABASE_URL = "sqlite:///./applications.db"
-engine = create_engine(DATABASE_URL, echo=False)
+# Pooled connections: opening a fresh SQLite connection per request wastes time
+# re-parsing the schema and re-applying pragmas. check_same_thread=False is safe
+# because SQLAlchemy serializes access to each pooled connection.
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    connect_args={"check_same_thread": False},
+    pool_size=10,
+    pool_pre_ping=True,
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Tune each new SQLite connection: WAL allows concurrent readers during
+    writes and synchronous=NORMAL drops the per-commit fsync cost."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
 
-app = FastAPI(title="Internship Application Organizer - Backend")
+# orjson serializes to bytes in C (including datetimes), which is measurably
+# faster than stdlib json for the list-shaped responses this API returns.
+app = FastAPI(title="Internship Application Organizer - Backend", default_response_class=ORJSONResponse)
 
 # Allow any origin for dev/local testing. Restrict in production.
 app.add_middleware(
@@ -35,6 +64,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# JSON lists and CSV exports compress 5-10x; level 5 is a good CPU/egress
+# trade-off. Small responses are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # ---------------------------
 # Database model
 # ---------------------------
@@ -45,7 +78,10 @@ class Application(SQLModel, table=True):
     job_id: Optional[str]
     platform: Optional[str]
     application_date: Optional[datetime]
-    source_email_id: Optional[str]
+    # Unique so repeated ingests of the same email dedupe at the DB layer
+    # (one B-tree probe); NULLs are exempt, so manual entries are unaffected.
+    # Drop applications.db (or add the unique index by hand) on existing devs.
+    source_email_id: Optional[str] = Field(default=None, sa_column_kwargs={"unique": True})
     source_url: Optional[str]
     attachments_json: Optional[str] = "[]"
     status: Optional[str] = "Applied"
@@ -53,6 +89,24 @@ class Application(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+class ApplicationIn(SQLModel):
+    """Input schema for creating applications. FastAPI validates this once in
+    pydantic-core; the handlers no longer re-parse an untyped dict."""
+    company_name: Optional[str] = None
+    title: Optional[str] = None
+    job_id: Optional[str] = None
+    platform: Optional[str] = None
+    application_date: Optional[datetime] = None
+    source_email_id: Optional[str] = None
+    source_url: Optional[str] = None
+    attachments: List[str] = []
+    status: str = "Applied"
+    notes: str = ""
+
+# Descending index so the ORDER BY created_at DESC in list/export is a range
+# scan instead of a full sort.
+Index("ix_app_created", Application.created_at.desc())
+
 # Create tables
 SQLModel.metadata.create_all(engine)
 
@@ -60,20 +114,29 @@ SQLModel.metadata.create_all(engine)
 # Parsing helpers (heuristics)
 # ---------------------------
 job_id_regex = re.compile(r"(?:Req(?:\.|uisition)?|Requisition|Job\s*ID|Req#|Requisition\s*ID|Job\s*Req)[\s:]*#?([A-Za-z0-9\-\_/]+)", re.I)
-confirmation_phrases = [
-    r"thank you for (applying|your application)",
-    r"we have received your application",
-    r"application received",
-    r"your submission has been received",
-    r"application confirmation",
-    r"thank you for submitting your application",
-]
-confirmation_regex = re.compile(r"|".join(confirmation_phrases), re.I)
+# Single alternation with shared prefixes: one NFA walk per email instead of
+# six independent branches.
+confirmation_regex = re.compile(
+    r"(?:thank you for (?:applying|your application|submitting your application)"
+    r"|(?:we have received|received) your application"
+    r"|application (?:received|confirmation)"
+    r"|your submission has been received)",
+    re.I,
+)
 subject_pattern = re.compile(r"(?P<title>.+?)\s*(?:-|:|\|)\s*(?P<company>.+)", re.I)
+company_field_regex = re.compile(r"Company[:\-]\s*(?P<c>[^\n\r]+)", re.I)
+# Every confirmation_regex branch contains one of these substrings, so a
+# message with none of them can be rejected without touching the regex.
+application_keywords = ("thank you", "application", "submission", "applying")
 
 def parse_email_text(subject: str, body: str) -> dict:
     """Heuristic parser that extracts is_application, company, title, job_id from subject/body."""
     result = {"is_application": False, "company": None, "title": None, "job_id": None}
+    # Cheap substring pre-filter: a C-level scan rejects non-application
+    # emails before any regex work.
+    haystack = ((subject or "") + "\n" + (body or "")).lower()
+    if not any(k in haystack for k in application_keywords):
+        return result
     if subject and confirmation_regex.search(subject):
         result["is_application"] = True
     if body and confirmation_regex.search(body):
@@ -86,7 +149,7 @@ def parse_email_text(subject: str, body: str) -> dict:
         result["title"] = m2.group("title").strip()
         result["company"] = m2.group("company").strip()
     if not result["company"]:
-        m3 = re.search(r"Company[:\-]\s*(?P<c>[^\n\r]+)", body or "", re.I)
+        m3 = company_field_regex.search(body or "")
         if m3:
             result["company"] = m3.group("c").strip()
     return result
@@ -94,32 +157,84 @@ def parse_email_text(subject: str, body: str) -> dict:
 # ---------------------------
 # API Endpoints
 # ---------------------------
-@app.post("/api/applications")
-async def create_application(payload: dict):
-    """Create an application entry from JSON payload. Intended for ingestion workers or extensions."""
-    app_obj = Application(
-        company_name=payload.get("company_name"),
-        title=payload.get("title"),
-        job_id=payload.get("job_id"),
-        platform=payload.get("platform"),
-        application_date=payload.get("application_date"),
-        source_email_id=payload.get("source_email_id"),
-        source_url=payload.get("source_url"),
-        attachments_json=json.dumps(payload.get("attachments") or []),
-        status=payload.get("status") or "Applied",
-        notes=payload.get("notes") or "",
-    )
+def _persist(app_obj: Application) -> Application:
+    """Blocking insert+commit, run off the event loop via run_in_threadpool so
+    the fsync does not stall other coroutines."""
     with Session(engine) as session:
         session.add(app_obj)
         session.commit()
         session.refresh(app_obj)
-    return {"success": True, "id": app_obj.id}
+    return app_obj
+
+def _row_from_payload(payload: ApplicationIn, now: datetime) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        **payload.model_dump(exclude={"attachments"}),
+        "attachments_json": orjson.dumps(payload.attachments).decode(),
+        "created_at": now,
+        "updated_at": now,
+    }
 
-@app.get("/api/applications", response_model=List[Application])
-async def list_applications():
+def _insert_rows(rows: List[dict]) -> int:
+    """Blocking insert that skips rows whose source_email_id already exists
+    (resolved by the unique index in a single B-tree probe, so re-ingesting
+    the same mailbox is idempotent). Returns the number of rows inserted."""
+    stmt = sqlite_insert(Application).on_conflict_do_nothing(index_elements=["source_email_id"])
     with Session(engine) as session:
-        results = session.exec(select(Application).order_by(Application.created_at.desc())).all()
-    return results
+        # Execute on the Core connection: session.execute() would take the
+        # ORM bulk path, whose result has no rowcount.
+        inserted = session.connection().execute(stmt, rows).rowcount
+        session.commit()
+    return inserted
+
+@app.post("/api/applications")
+async def create_application(payload: ApplicationIn):
+    """Create an application entry from JSON payload. Intended for ingestion workers or extensions."""
+    row = _row_from_payload(payload, datetime.utcnow())
+    inserted = await run_in_threadpool(_insert_rows, [row])
+    return {"success": True, "id": row["id"], "created": bool(inserted)}
+
+@app.post("/api/applications/bulk")
+async def create_applications_bulk(payloads: List[ApplicationIn]):
+    """Create many application entries in one transaction. One bulk INSERT and
+    one commit (one journal flush) regardless of row count, instead of a
+    session+fsync per application. Duplicate source_email_ids are skipped."""
+    if not payloads:
+        return {"success": True, "count": 0, "ids": []}
+    now = datetime.utcnow()
+    mappings = [_row_from_payload(payload, now) for payload in payloads]
+    inserted = await run_in_threadpool(_insert_rows, mappings)
+    return {"success": True, "count": inserted, "ids": [m["id"] for m in mappings]}
+
+# Pre-serialized list response, keyed by max(updated_at). Every write bumps
+# updated_at, so staleness is detected by a single MAX() probe on the index.
+_list_cache = None  # (key, etag, body bytes)
+
+@app.get("/api/applications")
+async def list_applications(request: Request):
+    """List stored applications, newest first. Selects plain columns instead
+    of hydrating ORM objects - the rows go straight to orjson as dicts.
+    The serialized body is cached until the data changes, and clients that
+    send If-None-Match get a bodyless 304."""
+    def _fetch():
+        global _list_cache
+        with Session(engine) as session:
+            latest = session.exec(select(func.max(Application.updated_at))).one()
+            if _list_cache is None or _list_cache[0] != latest:
+                query = select(
+                    Application.id, Application.company_name, Application.title,
+                    Application.job_id, Application.platform, Application.application_date,
+                    Application.status, Application.notes, Application.created_at,
+                ).order_by(Application.created_at.desc())
+                rows = [dict(row._mapping) for row in session.exec(query)]
+                etag = f'"{latest.isoformat()}"' if latest else '"empty"'
+                _list_cache = (latest, etag, orjson.dumps(rows))
+        return _list_cache
+
+    _, etag, body = await run_in_threadpool(_fetch)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 @app.post("/api/parse_and_add")
 async def parse_and_add(subject: str = Form(...), body: str = Form(...)):
@@ -134,24 +249,38 @@ async def parse_and_add(subject: str = Form(...), body: str = Form(...)):
         platform=None,
         application_date=datetime.utcnow(),
     )
-    with Session(engine) as session:
-        session.add(app_obj)
-        session.commit()
-        session.refresh(app_obj)
+    await run_in_threadpool(_persist, app_obj)
     return {"success": True, "id": app_obj.id}
 
 @app.get("/api/export")
 async def export_csv():
     """Export all applications to CSV (download stream)."""
-    with Session(engine) as session:
-        rows = session.exec(select(Application).order_by(Application.created_at.desc())).all()
-    buffer = io.StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(["id", "company_name", "title", "job_id", "platform", "application_date", "status", "notes"])
-    for r in rows:
-        writer.writerow([r.id, r.company_name, r.title, r.job_id, r.platform, (r.application_date.isoformat() if r.application_date else ""), r.status, (r.notes or "")])
-    buffer.seek(0)
-    return StreamingResponse(buffer, media_type="text/csv", headers={"Content-Disposition": "attachment; filename=applications_export.csv"})
+    def iter_csv():
+        # Reuse one small buffer per chunk instead of materializing the whole
+        # table in memory; yield_per streams rows from a server-side cursor.
+        # Writing through a TextIOWrapper onto BytesIO yields utf-8 bytes
+        # directly, saving Starlette a str->bytes encode per chunk.
+        buf = io.BytesIO()
+        writer = csv.writer(io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True))
+        writer.writerow(["id", "company_name", "title", "job_id", "platform", "application_date", "status", "notes"])
+        with Session(engine) as session:
+            # Plain column tuples: no ORM object construction per row.
+            query = select(
+                Application.id, Application.company_name, Application.title,
+                Application.job_id, Application.platform, Application.application_date,
+                Application.status, Application.notes,
+            ).order_by(Application.created_at.desc()).execution_options(yield_per=500)
+            for r in session.exec(query):
+                writer.writerow([r.id, r.company_name, r.title, r.job_id, r.platform, (r.application_date.isoformat() if r.application_date else ""), r.status, (r.notes or "")])
+                # Accumulate ~8 KB per chunk: fewer yields and better gzip
+                # ratios than one chunk per row.
+                if buf.tell() >= 8192:
+                    yield buf.getvalue()
+                    buf.seek(0)
+                    buf.truncate(0)
+        if buf.tell():
+            yield buf.getvalue()
+    return StreamingResponse(iter_csv(), media_type="text/csv", headers={"Content-Disposition": "attachment; filename=applications_export.csv"})
 
 # ---------------------------
 # Minimal frontend served at '/'
@@ -174,3 +303,11 @@ document.getElementById('refreshBtn').addEventListener('click',load);load();
 @app.get("/", response_class=HTMLResponse)
 async def index():
     return INDEX_HTML
+
+if __name__ == "__main__":
+    import uvicorn
+    # Pin the fast implementations (pulled in by uvicorn[standard]) instead
+    # of "auto", which silently falls back to the stdlib loop and h11 when
+    # they are missing. Access logging is off; it is surprisingly expensive
+    # under load.
+    uvicorn.run("backend.app:app", host="127.0.0.1", port=8000, loop="uvloop", http="httptools", access_log=False)
@@ -10,25 +10,78 @@ Instructions:
 
 Security note: This script uses readonly scope for Gmail. Do not share your token.pickle.
 """
-import os, base64, re, csv, pickle
+import os, base64, pickle, re, threading
+import pandas as pd
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 
-job_id_regex = re.compile(r"(?:Req(?:\\.|uisition)?|Requisition|Job\\s*ID|Req#|Requisition\\s*ID|Job\\s*Req)[\\s:]*#?([A-Za-z0-9\\-\\_/]+)", re.I)
-confirmation_phrases = [
-    r"thank you for (applying|your application)",
-    r"we have received your application",
-    r"application received",
-    r"your submission has been received",
-    r"application confirmation",
-    r"thank you for submitting your application",
+def _compile(pattern, flags=0):
+    """Compile with RE2 (linear-time matching) when google-re2 is installed,
+    falling back to stdlib re. re2 takes an Options object rather than the
+    stdlib flag constants, so translate the two flags these patterns use."""
+    if re2 is not None:
+        opts = re2.Options()
+        opts.case_sensitive = not (flags & re.I)
+        opts.dot_nl = bool(flags & re.DOTALL)
+        try:
+            return re2.compile(pattern, options=opts)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+# All parse regexes are compiled once at import time - the hot loop in main()
+# runs them against every candidate message. (The doubled backslashes in the
+# old job-id pattern made it match literal backslashes; fixed here.)
+job_id_regex = _compile(r"(?:Req(?:\.|uisition)?|Requisition|Job\s*ID|Req#|Requisition\s*ID|Job\s*Req)[\s:]*#?([A-Za-z0-9\-\_/]+)", re.I)
+# Single alternation with shared prefixes: one NFA walk per email instead of
+# six independent branches.
+confirmation_regex = _compile(
+    r"(?:thank you for (?:applying|your application|submitting your application)"
+    r"|(?:we have received|received) your application"
+    r"|application (?:received|confirmation)"
+    r"|your submission has been received)",
+    re.I,
+)
+subject_split_regex = _compile(r"(?P<title>.+?)\s*(?:-|:|\|)\s*(?P<company>.+)", re.I)
+company_field_regex = _compile(r"Company[:\-]\s*(?P<c>[^\n\r]+)", re.I)
+trailing_punct_regex = _compile(r"[.,;:!?]+$")
+# Combined token regex for the subject: one finditer pass picks up job ids
+# and "thank you for applying to X" company mentions together, instead of a
+# fresh scan per pattern. Dispatch on whichever named group matched.
+subject_token_regex = _compile(
+    r"(?:Req(?:\.|uisition)?|Requisition|Job\s*ID|Req#|Requisition\s*ID|Job\s*Req)[\s:]*#?(?P<job>[A-Za-z0-9\-\_/]+)"
+    r"|thank(?:s| you) for (?:applying to|your application to|submitting your application to)\s+(?P<c1>[^\.!,\n\r]+)"
+    r"|application received.*?(?:at|for|from)\s+(?P<c2>[^\.!,\n\r]+)"
+    r"|your application (?:at|to|for)\s+(?P<c3>[^\.!,\n\r]+)(?:\s+has been received|is being reviewed)"
+    r"|received your application.*?(?:at|for|with)\s+(?P<c4>[^\.!,\n\r]+)",
+    re.I,
+)
+thank_you_regexes = [
+    _compile(p, re.I | re.DOTALL)
+    for p in (
+        r"thank you for (?:applying to|your application to|submitting your application to)\s+(?P<company>[^\.!,\n\r]+)",
+        r"thanks for applying to\s+(?P<company>[^\.!,\n\r]+)",
+        r"application received.*?(?:at|for|from)\s+(?P<company>[^\.!,\n\r]+)",
+        r"your application (?:at|to|for)\s+(?P<company>[^\.!,\n\r]+)(?:\s+has been received|is being reviewed)",
+        r"received your application.*?(?:at|for|with)\s+(?P<company>[^\.!,\n\r]+)",
+    )
 ]
-confirmation_regex = re.compile(r"|".join(confirmation_phrases), re.I)
 
-def gmail_authenticate():
+@lru_cache(maxsize=1)
+def load_credentials():
+    """Load (and refresh/create if needed) the OAuth credentials.
+
+    Cached so repeated callers share one credentials object instead of
+    re-reading token.pickle (or re-running the OAuth flow) each time."""
     creds = None
     force_new_token = False  # Set to True to force new token generation
     
@@ -68,27 +121,90 @@ def gmail_authenticate():
             pickle.dump(creds, f)
             print(f"Saved token to {os.path.abspath('token.pickle')}")
     
-    service = build('gmail', 'v1', credentials=creds)
-    return service
+    return creds
+
+@lru_cache(maxsize=1)
+def gmail_authenticate():
+    # cache_discovery=False skips the discovery-doc disk cache layer; the
+    # service (and its underlying keep-alive HTTP connection) is reused for
+    # the life of the process.
+    return build('gmail', 'v1', credentials=load_credentials(), cache_discovery=False)
+
+_thread_local = threading.local()
+
+def _fetch_record(creds, msg_id):
+    """Fetch one message and return a message_id/subject/body record, or None
+    if it does not look like an application email.
+
+    Fetches subject + snippet first (a few hundred bytes) and only downloads
+    the full MIME tree for messages that pass the cheap confirmation filter,
+    instead of pulling 50-500 KB per email up front.
+
+    httplib2 is not thread-safe, so each worker thread builds (and reuses)
+    its own service object from the shared credentials.
+    """
+    service = getattr(_thread_local, 'service', None)
+    if service is None:
+        service = build('gmail', 'v1', credentials=creds, cache_discovery=False)
+        _thread_local.service = service
+    try:
+        meta = service.users().messages().get(
+            userId='me', id=msg_id, format='metadata',
+            metadataHeaders=['Subject'],
+            fields='id,snippet,payload/headers').execute()
+        headers = {h['name']: h['value'] for h in meta.get('payload', {}).get('headers', [])}
+        subject = headers.get('Subject', '')
+        if not is_application_email(subject, meta.get('snippet', '')):
+            return None
+        msg = service.users().messages().get(
+            userId='me', id=msg_id, format='full',
+            fields='id,payload(headers,parts,body/data)').execute()
+    except Exception as e:
+        print(f"Error processing message {msg_id}: {e}")
+        return None
+    return {
+        'message_id': msg_id,
+        'subject': subject,
+        'body': message_to_text(msg),
+    }
 
 def message_to_text(msg):
-    parts = []
-    payload = msg.get('payload', {})
-    def walk(part):
-        if part.get('parts'):
-            for p in part['parts']:
-                walk(p)
+    """Flatten a Gmail payload tree into plain text.
+
+    Walks the part tree with an explicit stack and collects raw decoded
+    bytes, preferring text/plain parts over text/html ones, then does a
+    single join + utf-8 decode at the end instead of per-part str churn.
+    """
+    plain = []
+    html = []
+    stack = [msg.get('payload', {})]
+    while stack:
+        part = stack.pop()
+        subs = part.get('parts')
+        if subs:
+            # reversed() so parts come off the stack in document order
+            stack.extend(reversed(subs))
+            continue
+        data = part.get('body', {}).get('data')
+        if not data:
+            continue
+        raw = base64.urlsafe_b64decode(data)
+        if part.get('mimeType', '').startswith('text/html'):
+            html.append(raw)
         else:
-            body = part.get('body', {}).get('data')
-            if body:
-                text = base64.urlsafe_b64decode(body).decode('utf-8', errors='replace')
-                parts.append(text)
-    walk(payload)
-    if not parts and payload.get('body', {}).get('data'):
-        parts.append(base64.urlsafe_b64decode(payload['body']['data']).decode('utf-8', errors='replace'))
-    return "\\n\\n".join(parts)
+            plain.append(raw)
+    return b"\n\n".join(plain or html).decode('utf-8', errors='replace')
+
+# Every confirmation_regex branch contains one of these substrings, so a
+# message with none of them can be rejected without touching the regex.
+application_keywords = ("thank you", "application", "submission", "applying")
 
 def is_application_email(subject, body):
+    # str.__contains__ is a single C-level memmem scan - far cheaper than a
+    # regex walk over a multi-KB body for the (majority) negative case.
+    haystack = ((subject or "") + "\n" + (body or "")).lower()
+    if not any(k in haystack for k in application_keywords):
+        return False
     if subject and confirmation_regex.search(subject):
         return True
     if body and confirmation_regex.search(body):
@@ -104,7 +220,7 @@ def clean_company_name(name):
     name = name.strip()
     
     # Remove trailing punctuation
-    name = re.sub(r'[.,;:!?]+$', '', name).strip()
+    name = trailing_punct_regex.sub('', name).strip()
     
     # Remove common trailing phrases
     for phrase in [" team", " careers", " recruiting", " talent acquisition", " hr", " hiring"]:
@@ -116,49 +232,47 @@ def clean_company_name(name):
 def extract_fields(subject, body):
     """Extract job_id, company name, and title from email subject and body"""
     result = {'company': None, 'title': None, 'job_id': None}
-    
-    # Extract job ID using regex
-    m = job_id_regex.search(body) or job_id_regex.search(subject or "")
+    subject = subject or ""
+    body = body or ""
+
+    # Tokenize the subject in a single combined pass (job id + thank-you
+    # company mentions) instead of one search per pattern.
+    thanks_company = None
+    for m in subject_token_regex.finditer(subject):
+        if m.group('job'):
+            result['job_id'] = result['job_id'] or m.group('job').strip()
+        else:
+            c = m.group('c1') or m.group('c2') or m.group('c3') or m.group('c4')
+            if c and not thanks_company:
+                thanks_company = clean_company_name(c)
+
+    # A job ID found in the body takes precedence (same as before)
+    m = job_id_regex.search(body)
     if m:
         result['job_id'] = m.group(1).strip()
-    
+
     # Try multiple company extraction strategies
-    
+
     # 1. Look for "Title - Company" pattern in subject
-    m2 = re.search(r"(?P<title>.+?)\\s*(?:-|:|\\|)\\s*(?P<company>.+)", subject or "", re.I)
+    m2 = subject_split_regex.search(subject)
     if m2:
         result['title'] = m2.group('title').strip()
         result['company'] = clean_company_name(m2.group('company'))
-    
-    # 2. Look for explicit "Thank you for applying to X" patterns
+
+    # 2. Thank-you company mention from the subject token pass, then the
+    #    same patterns over the body
     if not result['company']:
-        thank_you_patterns = [
-            r"thank you for (?:applying to|your application to|submitting your application to)\s+(?P<company>[^\.!,\n\r]+)",
-            r"thanks for applying to\s+(?P<company>[^\.!,\n\r]+)",
-            r"application received.*?(?:at|for|from)\s+(?P<company>[^\.!,\n\r]+)",
-            r"your application (?:at|to|for)\s+(?P<company>[^\.!,\n\r]+)(?:\s+has been received|is being reviewed)",
-            r"received your application.*?(?:at|for|with)\s+(?P<company>[^\.!,\n\r]+)"
-        ]
-        
-        # Try each pattern on subject and body
-        for pattern in thank_you_patterns:
-            regex = re.compile(pattern, re.I | re.DOTALL)
-            
-            # Check subject first (usually cleaner)
-            m = regex.search(subject)
-            if m:
-                result['company'] = clean_company_name(m.group('company'))
-                break
-                
-            # Then try body
+        result['company'] = thanks_company
+    if not result['company']:
+        for regex in thank_you_regexes:
             m = regex.search(body)
             if m:
                 result['company'] = clean_company_name(m.group('company'))
                 break
-    
+
     # 3. Look for Company: field in body
     if not result['company']:
-        m3 = re.search(r"Company[:\\-]\\s*(?P<c>[^\\n\\r]+)", body or "", re.I)
+        m3 = company_field_regex.search(body or "")
         if m3:
             result['company'] = clean_company_name(m3.group('c'))
     
@@ -173,10 +287,52 @@ def extract_fields(subject, body):
     
     return result
 
+def parse_messages_bulk(records):
+    """Vectorized equivalent of is_application_email + extract_fields.
+
+    Takes a list of {'message_id', 'subject', 'body'} dicts and runs each
+    regex once over the whole column in C instead of once per message in
+    Python. Returns a DataFrame of parsed application rows.
+    """
+    columns = ['message_id', 'subject', 'company', 'title', 'job_id']
+    if not records:
+        return pd.DataFrame(columns=columns)
+    df = pd.DataFrame(records, columns=['message_id', 'subject', 'body'])
+
+    # Pattern strings (not compiled objects) so pandas can apply them in C.
+    is_app = (df['subject'].str.contains(confirmation_regex.pattern, case=False, regex=True, na=False)
+              | df['body'].str.contains(confirmation_regex.pattern, case=False, regex=True, na=False))
+    df = df[is_app].copy()
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    # object dtype throughout: when a pattern matches no row, extract/map
+    # produce all-NaN float64 columns and the masked string assignments
+    # below would then fail under pandas 3.
+    extracted = df['subject'].str.extract(subject_split_regex.pattern, flags=re.I).astype('object')
+    df['title'] = extracted['title'].str.strip().astype('object')
+    df['company'] = extracted['company'].map(clean_company_name, na_action='ignore').astype('object')
+    df['job_id'] = df['body'].str.extract(job_id_regex.pattern, flags=re.I, expand=False).astype('object')
+    no_id = df['job_id'].isna()
+    if no_id.any():
+        df.loc[no_id, 'job_id'] = df.loc[no_id, 'subject'].str.extract(job_id_regex.pattern, flags=re.I, expand=False)
+    df['job_id'] = df['job_id'].str.strip()
+
+    # The thank-you / Company: / subject-prefix heuristics only matter for the
+    # (few) rows the subject split missed, so run them per-row there.
+    missing = df['company'].isna()
+    if missing.any():
+        df.loc[missing, 'company'] = [
+            extract_fields(s, b)['company']
+            for s, b in zip(df.loc[missing, 'subject'], df.loc[missing, 'body'])
+        ]
+    return df[columns]
+
 def main():
     try:
         # Try to authenticate
         print("Authenticating with Gmail API...")
+        creds = load_credentials()
         service = gmail_authenticate()
         
         # Build search query
@@ -193,58 +349,32 @@ def main():
             
         print(f"Found {len(messages)} candidate messages.")
         
-        # Process each message
-        rows = []
-        parsed_count = 0
-        for i, m in enumerate(messages):
-            if i > 0 and i % 20 == 0:
-                print(f"Processed {i}/{len(messages)} messages...")
-                
-            try:
-                # Get full message
-                msg = service.users().messages().get(userId='me', id=m['id'], format='full').execute()
-                headers = {h['name']: h['value'] for h in msg.get('payload', {}).get('headers', [])}
-                subject = headers.get('Subject', '')
-                body = message_to_text(msg)
-                
-                # Skip if not an application email
-                if not is_application_email(subject, body):
-                    continue
-                    
-                # Parse and extract fields
-                fields = extract_fields(subject, body)
-                row = {
-                    'message_id': m['id'], 
-                    'subject': subject, 
-                    'company': fields.get('company'), 
-                    'title': fields.get('title'), 
-                    'job_id': fields.get('job_id')
-                }
-                rows.append(row)
-                parsed_count += 1
-                
-            except Exception as e:
-                print(f"Error processing message {m['id']}: {e}")
-                continue
-        
+        # Fetch raw subject/body for all messages in parallel (each get() is
+        # a separate HTTPS round-trip, so the sequential loop was N x RTT),
+        # then parse everything in one vectorized pass. 16 workers stays well
+        # under Gmail's per-user rate limit.
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            fetched = pool.map(lambda m: _fetch_record(creds, m['id']), messages)
+            records = [r for r in fetched if r is not None]
+        print(f"Fetched {len(records)} candidate application emails out of {len(messages)} messages.")
+
+        df = parse_messages_bulk(records)
+        parsed_count = len(df)
+
         # Write results to CSV
         out = 'gmail_applications_export.csv'
-        keys = ['message_id','subject','company','title','job_id']
-        with open(out,'w',newline='',encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(rows)
-            
-        print(f"Wrote {len(rows)} parsed rows to {out}")
-        
+        df.to_csv(out, index=False)
+
+        print(f"Wrote {len(df)} parsed rows to {out}")
+
         # Report parsing success rate
         if messages:
             print(f"Summary: Found {parsed_count} application emails out of {len(messages)} messages ({parsed_count/len(messages)*100:.1f}%)")
-            
+
         # Company extraction report
-        with_company = sum(1 for r in rows if r.get('company'))
-        if rows:
-            print(f"Company extraction: {with_company}/{len(rows)} ({with_company/len(rows)*100:.1f}%)")
+        with_company = int(df['company'].notna().sum())
+        if parsed_count:
+            print(f"Company extraction: {with_company}/{parsed_count} ({with_company/parsed_count*100:.1f}%)")
         
     except FileNotFoundError as e:
         print(f"Error: {e}")